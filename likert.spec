@@ -20,7 +20,9 @@ a = Analysis(
         'pystray',
         'PIL',
         'webbrowser',
-        'requests'
+        'requests',
+        'waitress',
+        'orjson'
     ],
     hookspath=[],
     hooksconfig={},
@@ -1,13 +1,244 @@
-"""Core functionality for Likert scale correlation analysis."""
+"""Core functionality for Likert scale correlation analysis.
+
+pandas, plotly and scipy are imported inside the functions that use them so
+that importing this module, and starting the web server, stays fast.
+"""
+from __future__ import annotations
+
+import copy
+import io
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, BinaryIO, Dict, List, Optional, Tuple, Union
 
 import numpy as np
-import pandas as pd
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-from scipy import stats
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import plotly.graph_objects as go
+
+_INT8 = np.iinfo(np.int8)
+_INT16 = np.iinfo(np.int16)
+# Largest magnitude at which float64 still represents every whole number
+_EXACT_INT_LIMIT = 2.0 ** 53
+
+# Above this many rows the jittered scatter plot is replaced by a 2D histogram
+SCATTER_MAX_POINTS = 5000
+
+# Shared generator for the scatter plot jitter
+_RNG = np.random.default_rng(0)
+
+# Largest score grid for which Kendall's tau is counted from a contingency table
+KENDALL_TABLE_MAX_CELLS = 1 << 16
+
+
+def _spearman_from_ranks(r1: np.ndarray, r2: np.ndarray) -> Tuple[float, float]:
+    """Compute Spearman's rho and its two-sided p-value from average ranks.
+
+    Rho is taken as the Pearson correlation of the ranks so the result stays
+    exact for tie-heavy Likert data. The p-value uses the same t-distribution
+    approximation as ``scipy.stats.spearmanr``.
+    """
+    from scipy import stats
+
+    n = len(r1)
+    if n < 2:
+        return np.nan, np.nan
+    r1 = r1 - r1.mean()
+    r2 = r2 - r2.mean()
+    denom = np.sqrt(np.dot(r1, r1) * np.dot(r2, r2))
+    if denom == 0:
+        return np.nan, np.nan
+    rho = float(np.clip(np.dot(r1, r2) / denom, -1.0, 1.0))
+    if n < 3:
+        return rho, np.nan
+    if abs(rho) == 1.0:
+        return rho, 0.0
+    t = rho * np.sqrt((n - 2) / (1.0 - rho * rho))
+    p = float(2 * stats.t.sf(abs(t), n - 2))
+    return rho, p
+
+
+def _kendall_tau_b(a1: np.ndarray, a2: np.ndarray) -> Tuple[float, float]:
+    """Compute Kendall's tau-b and its asymptotic two-sided p-value.
+    
+    Integer scores on a small grid are counted from their contingency table;
+    anything else goes through ``scipy.stats.kendalltau``.
+    """
+    from scipy import stats
+
+    if (
+        len(a1) > 1
+        and np.issubdtype(a1.dtype, np.integer)
+        and np.issubdtype(a2.dtype, np.integer)
+    ):
+        lo1, lo2 = int(a1.min()), int(a2.min())
+        k1, k2 = int(a1.max()) - lo1 + 1, int(a2.max()) - lo2 + 1
+        if k1 * k2 <= KENDALL_TABLE_MAX_CELLS:
+            codes = (a1.astype(np.intp) - lo1) * k2 + (a2.astype(np.intp) - lo2)
+            table = np.bincount(codes, minlength=k1 * k2).reshape(k1, k2)
+            return _kendall_from_table(table)
+    return stats.kendalltau(a1, a2, variant='b', method='asymptotic')
+
+
+def _kendall_from_table(table: np.ndarray) -> Tuple[float, float]:
+    """Compute Kendall's tau-b and its p-value from a contingency table.
+    
+    Every observation in cell (i, j) is concordant with the observations in
+    cells below and to the right of it and discordant with those below and to
+    the left, so both counts come from two cumulative sums over the table in
+    O(cells) rather than a sort over the observations. Tie corrections and the
+    variance follow ``scipy.stats.kendalltau``.
+    """
+    from scipy import stats
+
+    table = table.astype(np.float64)
+    n = table.sum()
+    tot = n * (n - 1) / 2
+    
+    # below_right[i, j] = sum of table[i + 1:, j + 1:], below_left likewise
+    # with columns before j
+    below_right = np.zeros_like(table)
+    below_right[:-1, :-1] = table[::-1, ::-1].cumsum(0).cumsum(1)[::-1, ::-1][1:, 1:]
+    below_left = np.zeros_like(table)
+    below_left[:-1, 1:] = table[::-1].cumsum(0)[::-1].cumsum(1)[1:, :-1]
+    con_minus_dis = (table * (below_right - below_left)).sum()
+    
+    def tie_sums(counts):
+        counts = counts[counts > 1]
+        return ((counts * (counts - 1) / 2).sum(),
+                (counts * (counts - 1) * (counts - 2)).sum(),
+                (counts * (counts - 1) * (2 * counts + 5)).sum())
+    
+    xtie, x0, x1 = tie_sums(table.sum(axis=1))
+    ytie, y0, y1 = tie_sums(table.sum(axis=0))
+    if xtie == tot or ytie == tot:
+        return np.nan, np.nan
+    
+    tau = float(np.clip(con_minus_dis / np.sqrt(tot - xtie) / np.sqrt(tot - ytie), -1, 1))
+    m = n * (n - 1)
+    var = (m * (2 * n + 5) - x1 - y1) / 18 + (2 * xtie * ytie) / m
+    if n > 2:  # x0 and y0 are always zero for two observations
+        var += x0 * y0 / (9 * m * (n - 2))
+    p = float(2 * stats.norm.sf(abs(con_minus_dis) / np.sqrt(var)))
+    return tau, p
+
+
+def _score_counts(a: np.ndarray, lo: int, size: int = 0) -> np.ndarray:
+    """Count integer scores with a single bincount pass, indexed from ``lo``."""
+    return np.bincount(a.astype(np.intp) - lo, minlength=size)
+
+
+def _count_ties(a: np.ndarray) -> int:
+    """Count observations that repeat an earlier value."""
+    if len(a) == 0:
+        return 0
+    lo, hi = float(a.min()), float(a.max())
+    # Bincount only pays off for whole numbers on a range no wider than the
+    # data itself, e.g. scale scores; IDs or large codes go through np.unique
+    if (
+        hi - lo < len(a)
+        and max(abs(lo), abs(hi)) < _EXACT_INT_LIMIT
+        and (np.issubdtype(a.dtype, np.integer) or np.array_equal(a, np.rint(a)))
+    ):
+        counts = _score_counts(a, int(lo))
+        return len(a) - int(np.count_nonzero(counts))
+    return len(a) - np.unique(a).size
+
+
+def _downcast_scores(data: pd.DataFrame) -> pd.DataFrame:
+    """Store integer columns whose values fit in int8 as int8."""
+    # Walk columns by position so duplicate header names cannot collide
+    for i, dtype in enumerate(data.dtypes):
+        if not (isinstance(dtype, np.dtype) and dtype.kind in 'iu'):
+            continue
+        values = data.iloc[:, i]
+        if len(values) and _INT8.min <= values.min() and values.max() <= _INT8.max:
+            data.isetitem(i, values.astype(np.int8))
+    return data
+
+
+@lru_cache(maxsize=1)
+def _figure_template() -> go.Figure:
+    """Build the visualization layout once, with empty traces to fill per request.
+    
+    Copying this is much cheaper than rerunning make_subplots and the axis
+    updates for every analysis.
+    """
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    fig = make_subplots(
+        rows=4, cols=1,
+        subplot_titles=(
+            'Distribution',
+            'Distribution',
+            'Joint Distribution Heatmap',
+            'Scatter Plot with Jitter'
+        ),
+        vertical_spacing=0.1,
+        row_heights=[0.2, 0.2, 0.3, 0.3]
+    )
+
+    fig.add_trace(go.Bar(), row=1, col=1)
+    fig.add_trace(go.Bar(), row=2, col=1)
+
+    fig.add_trace(
+        go.Heatmap(
+            colorscale='Blues',
+            showscale=True,
+            colorbar=dict(
+                title='Count',
+                thickness=20,
+                lenmode='fraction',
+                len=0.3,
+                yanchor='middle',
+                y=0.4,
+                outlinewidth=0
+            )
+        ),
+        row=3, col=1
+    )
+
+    fig.add_trace(
+        go.Scatter(
+            mode='markers',
+            marker=dict(size=8, opacity=0.6),
+            name='Responses'
+        ),
+        row=4, col=1
+    )
+
+    fig.update_layout(
+        height=1440,
+        width=720,
+        showlegend=False,
+        title_text="Correlation Analysis Visualizations",
+        title_x=0.5,
+        margin=dict(
+            t=50,
+            b=50,
+            l=80,
+            r=90
+        ),
+        font=dict(size=12)
+    )
+    fig.update_xaxes(
+        tickmode='array',
+        tickangle=0,
+        dtick=1,
+        tickfont=dict(size=11),
+        title_font=dict(size=12)
+    )
+    fig.update_yaxes(title_font=dict(size=12))
+    fig.update_xaxes(title_text="Score", row=1, col=1)
+    fig.update_yaxes(title_text="Count", row=1, col=1)
+    fig.update_xaxes(title_text="Score", row=2, col=1)
+    fig.update_yaxes(title_text="Count", row=2, col=1)
+    for i in fig['layout']['annotations']:
+        i['font'] = dict(size=13)
+    return fig
 
 
 @dataclass
@@ -31,6 +262,13 @@ class Analyzer:
     def __init__(self):
         self.data: Optional[pd.DataFrame] = None
         self.columns: List[str] = []
+        self.load_count = 0  # Bumped on every load so callers can tell datasets apart
+        self._index: Dict[str, int] = {}
+        self._M: Optional[np.ndarray] = None
+        self._valid: Optional[np.ndarray] = None
+        self._valid_counts: Optional[np.ndarray] = None
+        self._R: Optional[np.ndarray] = None
+        self._integral: Optional[np.ndarray] = None
 
     def load_data(self, file_path: Union[str, Path]) -> List[str]:
         """Load data from CSV or Excel file.
@@ -45,43 +283,147 @@ class Analyzer:
             ValueError: If file format is not supported
         """
         file_path = Path(file_path)
-        if file_path.suffix.lower() == '.csv':
-            self.data = pd.read_csv(file_path)
-        elif file_path.suffix.lower() in ['.xlsx', '.xls']:
-            self.data = pd.read_excel(file_path)
+        return self._set_data(self._read_table(file_path, file_path.suffix))
+
+    def load_from_buffer(self, buffer: BinaryIO, suffix: str) -> List[str]:
+        """Load data from an open CSV or Excel file object.
+        
+        Args:
+            buffer: Binary file-like object positioned at the start of the data
+            suffix: File extension used to pick the parser, e.g. ``'.csv'``
+            
+        Returns:
+            List of column names
+            
+        Raises:
+            ValueError: If file format is not supported
+        """
+        if suffix.lower() in ['.xlsx', '.xls']:
+            # Excel readers need random access, which upload streams do not
+            # reliably offer (SpooledTemporaryFile lacks seekable() before 3.11)
+            buffer = io.BytesIO(buffer.read())
+        return self._set_data(self._read_table(buffer, suffix))
+
+    @staticmethod
+    def _read_table(source: Union[Path, BinaryIO], suffix: str) -> pd.DataFrame:
+        """Parse a CSV or Excel source into a DataFrame."""
+        import pandas as pd
+
+        if suffix.lower() == '.csv':
+            return pd.read_csv(source)
+        elif suffix.lower() in ['.xlsx', '.xls']:
+            return pd.read_excel(source)
         else:
             raise ValueError("Unsupported file format. Please use CSV or Excel files.")
-            
-        self.columns = list(self.data.columns)
+
+    def _set_data(self, data: pd.DataFrame) -> List[str]:
+        """Store freshly loaded data and rebuild the derived column caches.
+        
+        Everything is built into locals and swapped in together, and only then
+        is ``load_count`` bumped. A caller that reads the new load count will
+        therefore also see the new caches.
+        """
+        data = _downcast_scores(data)
+        columns = list(data.columns)
+        caches = self._precompute_columns(data)
+        (self.data, self.columns, self._index, self._M, self._valid,
+         self._valid_counts, self._R, self._integral) = (data, columns) + caches
+        self.load_count += 1
         return self.columns
 
     @staticmethod
-    def _interpret_kendall(tau: float) -> str:
-        """Interpret Kendall's tau correlation coefficient."""
-        if tau == 1:
-            return "Perfect agreement"
-        elif 0.4 <= abs(tau) < 1:
-            return f"Strong {'agreement' if tau > 0 else 'disagreement'}"
-        elif 0.1 <= abs(tau) < 0.4:
-            return f"Weak {'agreement' if tau > 0 else 'disagreement'}"
-        elif -0.1 < tau < 0.1:
-            return "No association"
-        else:
-            return "Perfect disagreement"
+    def _precompute_columns(data: pd.DataFrame) -> Tuple:
+        """Build the numeric columns as one contiguous matrix along with their ranks.
+        
+        ``M`` holds the scores as float64 with NaN for missing answers, and
+        ``R`` the average ranks of each column over its non-missing rows.
+        
+        Returns:
+            Tuple of (index, M, valid, valid_counts, R, integral)
+        """
+        from scipy import stats
+
+        numeric = data.select_dtypes('number')
+        index = {col: i for i, col in enumerate(numeric.columns)}
+        M = np.ascontiguousarray(numeric.to_numpy(dtype=np.float64))
+        valid = ~np.isnan(M)
+        valid_counts = valid.sum(axis=0)
+        R = np.full(M.shape, np.nan)
+        integral = np.zeros(len(index), dtype=bool)
+        for i in range(M.shape[1]):
+            values = M[valid[:, i], i]
+            R[valid[:, i], i] = stats.rankdata(values)
+            # Whole-number scores are handed to _kendall_tau_b as int16 so it
+            # can count Kendall's tau from their contingency table
+            integral[i] = (
+                len(values) > 0
+                and np.array_equal(values, np.rint(values))
+                and _INT16.min <= values.min()
+                and values.max() <= _INT16.max
+            )
+        return index, M, valid, valid_counts, R, integral
+
+    def _pair(self, col1: str, col2: str) -> Tuple[np.ndarray, ...]:
+        """Return scores and ranks of two columns over rows where both are present.
+        
+        Returns:
+            Tuple of (scores1, scores2, ranks1, ranks2)
+        """
+        from scipy import stats
+
+        i = self._column_index(col1)
+        j = self._column_index(col2)
+        mask = self._valid[:, i] & self._valid[:, j]
+        n = np.count_nonzero(mask)
+        scores, ranks = [], []
+        for col in (i, j):
+            values = self._M[mask, col]
+            # Cached ranks only hold when the pair drops no rows of this column
+            if self._valid_counts[col] == n:
+                ranks.append(self._R[mask, col])
+            else:
+                ranks.append(stats.rankdata(values))
+            scores.append(values.astype(np.int16) if self._integral[col] else values)
+        return scores[0], scores[1], ranks[0], ranks[1]
+
+    def _column_index(self, col: str) -> int:
+        """Return the position of a numeric column in the cached score matrix."""
+        if col not in self._index:
+            raise ValueError(f"Column '{col}' does not contain numeric scores.")
+        return self._index[col]
+
+    # Interpretation tables: a row per sign (negative, positive) and a column
+    # per strength bin, selected by searching |coefficient| in the bin edges
+    _KENDALL_EDGES = np.array([0.1, 0.4, 1.0])
+    _KENDALL_LABELS = np.array([
+        ["No association", "Weak disagreement", "Strong disagreement",
+         "Perfect disagreement"],
+        ["No association", "Weak agreement", "Strong agreement",
+         "Perfect agreement"],
+    ])
+    _SPEARMAN_EDGES = np.array([0.1, 0.5, 1.0])
+    _SPEARMAN_LABELS = np.array([
+        ["No correlation", "Weak negative correlation",
+         "Strong negative correlation", "Perfect negative correlation"],
+        ["No correlation", "Weak positive correlation",
+         "Strong positive correlation", "Perfect positive correlation"],
+    ])
 
     @staticmethod
-    def _interpret_spearman(rho: float) -> str:
+    def _interpret(coef: float, edges: np.ndarray, labels: np.ndarray) -> str:
+        """Look up the label for a coefficient in an interpretation table."""
+        strength = np.searchsorted(edges, abs(coef), side='right')
+        return str(labels[int(coef > 0), strength])
+
+    @classmethod
+    def _interpret_kendall(cls, tau: float) -> str:
+        """Interpret Kendall's tau correlation coefficient."""
+        return cls._interpret(tau, cls._KENDALL_EDGES, cls._KENDALL_LABELS)
+
+    @classmethod
+    def _interpret_spearman(cls, rho: float) -> str:
         """Interpret Spearman's rho correlation coefficient."""
-        if rho == 1:
-            return "Perfect positive correlation"
-        elif 0.5 <= abs(rho) < 1:
-            return f"Strong {'positive' if rho > 0 else 'negative'} correlation"
-        elif 0.1 <= abs(rho) < 0.5:
-            return f"Weak {'positive' if rho > 0 else 'negative'} correlation"
-        elif -0.1 < rho < 0.1:
-            return "No correlation"
-        else:
-            return "Perfect negative correlation"
+        return cls._interpret(rho, cls._SPEARMAN_EDGES, cls._SPEARMAN_LABELS)
 
     def analyze(self, col1: str, col2: str) -> AnalysisResults:
         """Perform correlation analysis on two columns.
@@ -96,20 +438,19 @@ class Analyzer:
         if self.data is None:
             raise ValueError("No data loaded. Call load_data() first.")
 
-        data1 = self.data[col1].dropna()
-        data2 = self.data[col2].dropna()
+        a1, a2, r1, r2 = self._pair(col1, col2)
         
         # Calculate correlations
-        kendall_tau, kendall_p = stats.kendalltau(data1, data2)
-        spearman_rho, spearman_p = stats.spearmanr(data1, data2)
+        kendall_tau, kendall_p = _kendall_tau_b(a1, a2)
+        spearman_rho, spearman_p = _spearman_from_ranks(r1, r2)
         
         # Count ties
-        ties1 = len(data1) - len(data1.unique())
-        ties2 = len(data2) - len(data2.unique())
+        ties1 = _count_ties(a1)
+        ties2 = _count_ties(a2)
         total_ties = ties1 + ties2
         
         # Determine recommended method
-        sample_size = len(data1)
+        sample_size = len(a1)
         if sample_size < 30:
             recommended = "Kendall's tau"
             reason = "Small sample size (n < 30)"
@@ -133,132 +474,133 @@ class Analyzer:
             spearman_interpretation=self._interpret_spearman(spearman_rho)
         )
 
+    def all_pairs_spearman(self) -> pd.DataFrame:
+        """Compute Spearman's rho for every pair of numeric columns.
+        
+        Spearman's rho is the Pearson correlation of ranks, so columns without
+        missing answers are handled by a single np.corrcoef over their cached
+        ranks. Pairs involving a column with missing answers are computed over
+        the rows both columns share, as in analyze().
+        
+        Returns:
+            Square DataFrame of correlations indexed by column name
+        """
+        import pandas as pd
+
+        if self.data is None:
+            raise ValueError("No data loaded. Call load_data() first.")
+
+        columns = list(self._index)
+        k = len(columns)
+        rho = np.full((k, k), np.nan)
+        complete = self._valid_counts == len(self._M)
+        
+        full = np.flatnonzero(complete)
+        if len(full):
+            with np.errstate(divide='ignore', invalid='ignore'):
+                rho[np.ix_(full, full)] = np.corrcoef(self._R[:, full], rowvar=False)
+        
+        for i in np.flatnonzero(~complete):
+            for j in range(k):
+                if j < i and not complete[j]:
+                    continue  # Already filled from the other side
+                _, _, r1, r2 = self._pair(columns[i], columns[j])
+                rho[i, j] = rho[j, i] = _spearman_from_ranks(r1, r2)[0]
+        
+        return pd.DataFrame(rho, index=columns, columns=columns)
+
+    @staticmethod
+    def create_correlation_heatmap(matrix: pd.DataFrame) -> go.Figure:
+        """Create a heatmap figure of a correlation matrix."""
+        import plotly.graph_objects as go
+
+        fig = go.Figure(
+            go.Heatmap(
+                z=matrix.to_numpy(dtype=np.float32),
+                x=list(matrix.columns),
+                y=list(matrix.index),
+                zmin=-1,
+                zmax=1,
+                colorscale='RdBu',
+                colorbar=dict(title="Spearman's rho")
+            )
+        )
+        fig.update_layout(
+            title_text="Spearman Correlation Matrix",
+            title_x=0.5,
+            yaxis=dict(autorange='reversed'),
+            font=dict(size=12)
+        )
+        return fig
+
     def create_visualizations(self, col1: str, col2: str) -> go.Figure:
         """Create visualization figures for the correlation analysis."""
+        import plotly.graph_objects as go
+
         if self.data is None:
             raise ValueError("No data loaded. Call load_data() first.")
-        data1 = self.data[col1].dropna()
-        data2 = self.data[col2].dropna()
+        i = self._column_index(col1)
+        j = self._column_index(col2)
     
-        all_values = list(range(int(min(data1.min(), data2.min())), int(max(data1.max(), data2.max())) + 1))
+        scores1 = np.rint(self._M[self._valid[:, i], i])
+        scores2 = np.rint(self._M[self._valid[:, j], j])
+        lo = int(min(scores1.min(), scores2.min()))
+        hi = int(max(scores1.max(), scores2.max()))
+        all_values = np.arange(lo, hi + 1)
     
-        counts1 = data1.value_counts().reindex(all_values, fill_value=0).sort_index()
-        counts2 = data2.value_counts().reindex(all_values, fill_value=0).sort_index()
+        counts1 = _score_counts(scores1, lo, len(all_values))
+        counts2 = _score_counts(scores2, lo, len(all_values))
     
-        fig = make_subplots(
-            rows=4, cols=1,
-            subplot_titles=(
-                f'Distribution of {col1}',
-                f'Distribution of {col2}',
-                'Joint Distribution Heatmap',
-                'Scatter Plot with Jitter'
-            ),
-            vertical_spacing=0.1,
-            row_heights=[0.2, 0.2, 0.3, 0.3]
-        )
+        # Start from a copy of the prebuilt layout and only fill in the data
+        fig = copy.deepcopy(_figure_template())
+        bar1, bar2, heatmap, scatter = fig.data
+        fig.layout.annotations[0].text = f'Distribution of {col1}'
+        fig.layout.annotations[1].text = f'Distribution of {col2}'
     
-        fig.add_trace(
-            go.Bar(x=counts1.index, y=counts1.values, name=col1),
-            row=1, col=1
-        )
-    
-        fig.add_trace(
-            go.Bar(x=counts2.index, y=counts2.values, name=col2),
-            row=2, col=1
-        )
+        bar1.update(x=all_values, y=counts1, name=col1)
+        bar2.update(x=all_values, y=counts2, name=col2)
     
-        heatmap_data = pd.crosstab(data1, data2)
-        for val1 in all_values:
-            if val1 not in heatmap_data.index:
-                heatmap_data.loc[val1] = 0
-        for val2 in all_values:
-            if val2 not in heatmap_data.columns:
-                heatmap_data[val2] = 0
+        # Joint counts over rows where both columns are present, as a flat
+        # k*k bincount reshaped so that heatmap[i, j] counts (lo + i, lo + j)
+        k = len(all_values)
+        mask = self._valid[:, i] & self._valid[:, j]
+        x, y = self._M[mask, i], self._M[mask, j]
+        codes = (np.rint(x).astype(np.intp) - lo) * k + (np.rint(y).astype(np.intp) - lo)
+        heatmap_data = np.bincount(codes, minlength=k * k).reshape(k, k).astype(np.int32)
     
-        heatmap_data = heatmap_data.sort_index().sort_index(axis=1)
+        heatmap.update(z=heatmap_data, x=all_values, y=all_values)
     
-        # Add heatmap trace without a colorbar first
-        fig.add_trace(
-            go.Heatmap(
-                z=heatmap_data.values,
-                x=heatmap_data.columns,
-                y=heatmap_data.index,
-                colorscale='Blues',
-                showscale=False  # Hide the colorbar for this trace
-            ),
-            row=3, col=1
-        )
-        
-        # Add an empty scatter trace in the heatmap subplot that will hold our colorbar
-        fig.add_trace(
-            go.Scatter(
-                x=[None],
-                y=[None],
-                mode='markers',
-                marker=dict(
+        if len(x) > SCATTER_MAX_POINTS:
+            # Too many markers to ship and render; bin the pairs on the score
+            # grid instead, sending only the k*k precomputed joint counts
+            fig.data = fig.data[:-1]
+            fig.layout.annotations[3].text = 'Binned Joint Distribution'
+            grid_x, grid_y = np.meshgrid(all_values, all_values, indexing='ij')
+            bins = dict(start=lo - 0.5, end=hi + 0.5, size=1)
+            fig.add_trace(
+                go.Histogram2d(
+                    x=grid_x.ravel(),
+                    y=grid_y.ravel(),
+                    z=heatmap_data.ravel(),
+                    histfunc='sum',
+                    xbins=bins,
+                    ybins=bins,
                     colorscale='Blues',
-                    showscale=True,
-                    cmin=heatmap_data.values.min(),
-                    cmax=heatmap_data.values.max(),
-                    colorbar=dict(
-                        title='Count',
-                        thickness=20,
-                        lenmode='fraction',
-                        len=0.3,
-                        yanchor='middle',
-                        y=0.4,
-                        outlinewidth=0
-                    )
+                    showscale=False,
+                    name='Responses'
                 ),
-                showlegend=False
-            ),
-            row=3, col=1
-        )
-    
-        jitter = np.random.normal(0, 0.1, size=len(data1))
-        fig.add_trace(
-            go.Scatter(
-                x=data1 + jitter,
-                y=data2 + jitter,
-                mode='markers',
-                marker=dict(size=8, opacity=0.6),
-                name='Responses'
-            ),
-            row=4, col=1
-        )
-    
-        fig.update_layout(
-            height=1440,
-            width=720,
-            showlegend=False,
-            title_text="Correlation Analysis Visualizations",
-            title_x=0.5,
-            margin=dict(
-                t=50,
-                b=50,
-                l=80,
-                r=90
-            ),
-            font=dict(size=12)
-        )
-        for i in range(1, 5):
-            fig.update_xaxes(
-                row=i, col=1,
-                tickmode='array',
-                tickvals=all_values,
-                ticktext=all_values,
-                tickangle=0,
-                dtick=1,
-                tickfont=dict(size=11)
+                row=4, col=1
             )
-        fig.update_xaxes(title_text="Score", title_font=dict(size=12), row=1, col=1)
-        fig.update_yaxes(title_text="Count", title_font=dict(size=12), row=1, col=1)
-        fig.update_xaxes(title_text="Score", title_font=dict(size=12), row=2, col=1)
-        fig.update_yaxes(title_text="Count", title_font=dict(size=12), row=2, col=1)
-        fig.update_xaxes(title_text=f"{col1} Score", title_font=dict(size=12), row=3, col=1)
-        fig.update_yaxes(title_text=f"{col2} Score", title_font=dict(size=12), row=3, col=1)
-        fig.update_xaxes(title_text=f"{col1} Score", title_font=dict(size=12), row=4, col=1)
-        fig.update_yaxes(title_text=f"{col2} Score", title_font=dict(size=12), row=4, col=1)
-        for i in fig['layout']['annotations']:
-            i['font'] = dict(size=13)
+        else:
+            jitter = _RNG.standard_normal(len(x), dtype=np.float32) * np.float32(0.1)
+            scatter.update(
+                x=x.astype(np.float32) + jitter,
+                y=y.astype(np.float32) + jitter
+            )
+    
+        fig.update_xaxes(tickvals=all_values, ticktext=all_values)
+        for axis in (fig.layout.xaxis3, fig.layout.xaxis4):
+            axis.title.text = f"{col1} Score"
+        for axis in (fig.layout.yaxis3, fig.layout.yaxis4):
+            axis.title.text = f"{col2} Score"
         return fig
\ No newline at end of file
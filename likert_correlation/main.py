@@ -1,4 +1,5 @@
 """Main entry point for the Likert Scale Correlation Analyzer."""
+import logging
 import sys
 import threading
 import webbrowser
@@ -6,11 +7,9 @@ from pathlib import Path
 from time import sleep
 
 import pystray
-import requests
 from PIL import Image
 from pystray import MenuItem as item
-
-from likert_correlation.web import create_app
+from waitress import create_server
 
 class LikertAnalyzer:
     def __init__(self):
@@ -19,20 +18,52 @@ class LikertAnalyzer:
             # Running from PyInstaller bundle
             self.base_dir = Path(sys._MEIPASS) / 'likert_correlation'
         
-        # Initialize Flask app
-        self.app = create_app(self.base_dir)
+        # The Flask app is created by the server thread, see run_server()
+        self.app = None
+        self.server = None
+        self.server_ready = threading.Event()
         self.server_thread = None
         self.icon = None
-        self.url = "http://localhost:5000"
+        self.url = "http://127.0.0.1:5000"
         
     def run_server(self):
-        """Run Flask server in a separate thread."""
-        self.app.run(host='0.0.0.0', port=5000, debug=False, use_reloader=False)
+        """Run the app under waitress in a separate thread."""
+        try:
+            # Imported here so the tray icon is not held up by pandas/Flask imports
+            from likert_correlation.web import create_app
+
+            self.app = create_app(self.base_dir)
+            self.server = create_server(self.app, host='127.0.0.1', port=5000, threads=8)
+        except Exception as e:
+            logging.exception("Could not start the analysis server")
+            self.server = None
+            self.report_startup_failure(e)
+            return
+        finally:
+            # Always release open_browser(), even when startup failed
+            self.server_ready.set()
+        threading.Thread(target=self.wait_for_shutdown, daemon=True).start()
+        self.server.run()
+
+    def wait_for_shutdown(self):
+        """Stop the server once the /shutdown route has been hit."""
+        self.app.extensions['shutdown_event'].wait()
+        self.server.close()
         
+    def report_startup_failure(self, error):
+        """Tell the user the server could not start and remove the tray icon."""
+        if self.icon is None:
+            return
+        if self.icon.HAS_NOTIFICATION:
+            self.icon.notify(f"Could not start the server: {error}", "Likert Scale Analyzer")
+            sleep(5)  # Give the notification time to be read
+        self.icon.stop()
+
     def open_browser(self):
-        """Open web browser after short delay to ensure server is running."""
-        sleep(1.5)  # Wait for server to start
-        webbrowser.open(self.url)
+        """Open web browser once the server is listening."""
+        self.server_ready.wait()
+        if self.server is not None:
+            webbrowser.open(self.url)
         
     def create_system_tray(self):
         """Create system tray icon with menu."""
@@ -51,6 +82,7 @@ class LikertAnalyzer:
             icon.stop()
             if self.server_thread and self.server_thread.is_alive():
                 try:
+                    import requests
                     requests.get(f"{self.url}/shutdown")
                 except:
                     pass
@@ -68,19 +100,23 @@ class LikertAnalyzer:
             menu
         )
         
-    def run(self):
-        """Run the complete application."""
+    def start_services(self, icon):
+        """Show the tray icon, then start the server and open the browser."""
+        icon.visible = True
+        
         # Start Flask server in separate thread
         self.server_thread = threading.Thread(target=self.run_server)
         self.server_thread.daemon = True
         self.server_thread.start()
         
         # Open browser
-        threading.Thread(target=self.open_browser).start()
+        threading.Thread(target=self.open_browser, daemon=True).start()
         
-        # Create and run system tray icon
+    def run(self):
+        """Run the complete application."""
+        # Services start once the icon is up, so a failed startup can stop it
         self.create_system_tray()
-        self.icon.run()
+        self.icon.run(setup=self.start_services)
 
 def main():
     """Entry point for the application."""
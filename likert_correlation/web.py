@@ -1,12 +1,17 @@
 """Web interface for Likert scale correlation analysis."""
-import tempfile
+import threading
+from collections import OrderedDict
 from pathlib import Path
 
+import numpy as np
 from flask import Flask, jsonify, render_template, request, Response
 from werkzeug.utils import secure_filename
 
 from .analyzer import Analyzer
 
+# Number of analyzed column pairs kept in memory per app
+RESULTS_CACHE_SIZE = 64
+
 def create_app(base_dir: Path = None) -> Flask:
     """Create and configure the Flask application."""
     if base_dir is None:
@@ -16,16 +21,18 @@ def create_app(base_dir: Path = None) -> Flask:
                 template_folder=str(base_dir / 'templates'),
                 static_folder=str(base_dir / 'static'))
     
-    # Use system temp directory for uploads
-    app.config['UPLOAD_FOLDER'] = Path(tempfile.gettempdir()) / 'likert_correlation'
     app.config['MAX_CONTENT_LENGTH'] = 1024 * 1024 * 1024  # 1GB max file size
 
-    # Ensure upload folder exists
-    app.config['UPLOAD_FOLDER'].mkdir(exist_ok=True)
+    # Set by /shutdown; the process hosting the app waits on it to stop serving
+    app.extensions['shutdown_event'] = threading.Event()
 
     # Global analyzer instance
     analyzer = Analyzer()
 
+    # LRU cache of serialized /analyze responses, keyed by (load, col1, col2)
+    results_cache = OrderedDict()
+    cache_lock = threading.Lock()
+
     @app.route('/')
     def index():
         """Render the main page."""
@@ -42,17 +49,15 @@ def create_app(base_dir: Path = None) -> Flask:
             return jsonify({'error': 'No selected file'}), 400
             
         if file:
-            filename = secure_filename(file.filename)
-            filepath = app.config['UPLOAD_FOLDER'] / filename
+            suffix = Path(secure_filename(file.filename)).suffix
             
             try:
-                file.save(filepath)
-                columns = analyzer.load_data(filepath)
-                filepath.unlink()  # Clean up the file after reading
+                # Parse straight from the upload stream rather than a temp copy
+                columns = analyzer.load_from_buffer(file.stream, suffix)
+                with cache_lock:
+                    results_cache.clear()
                 return jsonify({'columns': columns})
             except Exception as e:
-                if filepath.exists():
-                    filepath.unlink()
                 return jsonify({'error': str(e)}), 400
 
     @app.route('/analyze', methods=['POST'])
@@ -62,10 +67,20 @@ def create_app(base_dir: Path = None) -> Flask:
         col1 = data.get('col1')
         col2 = data.get('col2')
         
-        if not (col1 and col2):
+        if not (isinstance(col1, str) and isinstance(col2, str) and col1 and col2):
             return jsonify({'error': 'Please select both columns'}), 400
+
+        # Keyed by load count, so results computed against data replaced by a
+        # concurrent upload can never be served for the new data
+        key = (analyzer.load_count, col1, col2)
+        with cache_lock:
+            if key in results_cache:
+                results_cache.move_to_end(key)
+                return jsonify(results_cache[key])
             
         try:
+            import plotly.io as pio
+
             # Get analysis results
             results = analyzer.analyze(col1, col2)
             fig = analyzer.create_visualizations(col1, col2)
@@ -90,7 +105,33 @@ def create_app(base_dir: Path = None) -> Flask:
                     'sample_size': results.sample_size,
                     'total_ties': results.total_ties
                 },
-                'visualizations': fig.to_json()
+                'visualizations': pio.to_json(fig, validate=False, engine='orjson')
+            }
+
+            with cache_lock:
+                results_cache[key] = response
+                if len(results_cache) > RESULTS_CACHE_SIZE:
+                    results_cache.popitem(last=False)
+            
+            return jsonify(response)
+        except Exception as e:
+            return jsonify({'error': str(e)}), 400
+
+    @app.route('/analyze_all', methods=['POST'])
+    def analyze_all():
+        """Compute the Spearman correlation matrix of all numeric columns."""
+        try:
+            import plotly.io as pio
+
+            matrix = analyzer.all_pairs_spearman()
+            fig = analyzer.create_correlation_heatmap(matrix)
+            
+            # Undefined correlations (e.g. constant columns) are sent as null
+            values = matrix.to_numpy()
+            response = {
+                'columns': list(matrix.columns),
+                'matrix': np.where(np.isnan(values), None, values).tolist(),
+                'visualizations': pio.to_json(fig, validate=False, engine='orjson')
             }
             
             return jsonify(response)
@@ -100,10 +141,7 @@ def create_app(base_dir: Path = None) -> Flask:
     @app.route('/shutdown', methods=['GET'])
     def shutdown():
         """Shutdown the Flask server cleanly."""
-        func = request.environ.get('werkzeug.server.shutdown')
-        if func is None:
-            raise RuntimeError('Not running with the Werkzeug Server')
-        func()
+        app.extensions['shutdown_event'].set()
         return 'Server shutting down...'
 
     @app.route('/health', methods=['GET'])
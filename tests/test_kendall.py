@@ -0,0 +1,64 @@
+"""Tests for the contingency-table Kendall's tau-b implementation."""
+import numpy as np
+import pytest
+from scipy import stats
+
+from likert_correlation.analyzer import _kendall_tau_b
+
+
+def _scipy_tau_b(a1, a2):
+    result = stats.kendalltau(a1, a2, variant='b', method='asymptotic')
+    return result.statistic, result.pvalue
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_matches_scipy_on_tied_integer_scores(seed):
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(3, 500))
+    a1 = rng.integers(1, int(rng.integers(2, 8)) + 1, n).astype(np.int16)
+    a2 = np.clip(a1 + rng.integers(-2, 3, n), 1, 7).astype(np.int16)
+
+    tau, p = _kendall_tau_b(a1, a2)
+    expected_tau, expected_p = _scipy_tau_b(a1, a2)
+
+    assert tau == pytest.approx(expected_tau, abs=1e-12)
+    assert p == pytest.approx(expected_p, rel=1e-9, abs=1e-300)
+
+
+def test_matches_scipy_on_independent_scores():
+    rng = np.random.default_rng(0)
+    a1 = rng.integers(1, 6, 1000).astype(np.int16)
+    a2 = rng.integers(-3, 4, 1000).astype(np.int16)
+
+    tau, p = _kendall_tau_b(a1, a2)
+    expected_tau, expected_p = _scipy_tau_b(a1, a2)
+
+    assert tau == pytest.approx(expected_tau, abs=1e-12)
+    assert p == pytest.approx(expected_p, rel=1e-9)
+
+
+def test_all_tied_column_is_undefined():
+    a1 = np.full(20, 3, dtype=np.int16)
+    a2 = np.arange(20, dtype=np.int16) % 5
+
+    tau, p = _kendall_tau_b(a1, a2)
+    expected_tau, expected_p = _scipy_tau_b(a1, a2)
+
+    assert np.isnan(tau) and np.isnan(p)
+    assert np.isnan(expected_tau) and np.isnan(expected_p)
+
+
+@pytest.mark.parametrize("a2, expected_tau", [([1, 2], 1.0), ([2, 1], -1.0)])
+def test_two_observations(a2, expected_tau):
+    # SciPy divides by n - 2 in the variance here and raises ZeroDivisionError
+    tau, p = _kendall_tau_b(np.array([1, 2], np.int16), np.array(a2, np.int16))
+
+    assert tau == expected_tau
+    assert p == pytest.approx(2 * stats.norm.sf(1))
+
+
+def test_float_scores_fall_back_to_scipy():
+    a1 = np.array([1.5, 2.0, 3.5, 4.0, 2.0])
+    a2 = np.array([1.0, 3.0, 2.5, 4.0, 2.0])
+
+    assert _kendall_tau_b(a1, a2) == pytest.approx(_scipy_tau_b(a1, a2))